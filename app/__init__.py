@@ -1,17 +1,57 @@
-from flask import Flask
+from flask import Flask, request
 from flask_socketio import SocketIO
+from . import config
+import atexit
 import logging
+import logging.handlers
+import orjson
+import queue
 
-# Configure logging to help debug WebSocket issues
-logging.basicConfig(level=logging.INFO)
+# Configure logging to help debug WebSocket issues. Records are queued and
+# written to stderr by a background listener, so request and reader
+# threads never wait on the console.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+# getLevelName maps a known level name to its number; an unknown one would
+# make basicConfig raise during import, so fall back to INFO instead
+_log_level_ok = isinstance(logging.getLevelName(config.LOG_LEVEL), int)
+logging.basicConfig(level=config.LOG_LEVEL if _log_level_ok else logging.INFO,
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger(__name__)
+
+if not _log_level_ok:
+    log.warning("⚠️ Unknown IOT_LOG_LEVEL %r, using INFO", config.LOG_LEVEL)
+
+class _OrjsonModule:
+    """json-module shim so Socket.IO packets are encoded with orjson"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        # Socket.IO passes stdlib options (separators); orjson is compact anyway
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
 
 socketio = SocketIO(
+    json=_OrjsonModule,
     cors_allowed_origins="*",
-    logger=True,
-    engineio_logger=True,
-    async_mode='threading'
+    logger=config.DEBUG,
+    engineio_logger=config.DEBUG,
+    async_mode=config.SOCKETIO_ASYNC_MODE
 )
 
+def broadcast_sensor_update(payload):
+    """Push one sensor update to every connected dashboard"""
+    # A single broadcast emit (no `to=`) is encoded once by the Socket.IO
+    # client manager and the same packet is queued for each client,
+    # instead of re-encoding the payload per connection
+    socketio.emit("new_data", payload)
+
 def create_app():
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'secret!'
@@ -26,11 +66,11 @@ def create_app():
     # Add WebSocket event handlers
     @socketio.on('connect')
     def handle_connect():
-        print(f"🔌 Client connected: {request.sid if 'request' in globals() else 'unknown'}")
+        log.info("🔌 Client connected: %s", request.sid)
     
     @socketio.on('disconnect')
     def handle_disconnect():
-        print(f"🔌 Client disconnected: {request.sid if 'request' in globals() else 'unknown'}")
+        log.info("🔌 Client disconnected: %s", request.sid)
     
-    print("✅ Flask app created with SocketIO initialized")
+    log.info("✅ Flask app created with SocketIO initialized (async mode: %s)", socketio.async_mode)
     return app
\ No newline at end of file
@@ -1,10 +1,12 @@
 # app/config.py
+import os
 
 # Data source configuration
 USE_MOCK = False  # Set to False to use real serial device
 SERIAL_PORT = 'COM7'  # Default COM port - can be changed via UI
 BAUD_RATE = 9600  # Default baud rate - can be changed via UI
 TIMEOUT = 1
+PORT_PROBE_TIMEOUT = 1.5  # Max seconds /api/test-connection waits for a port to open
 
 # Available baud rates for the UI dropdown
 AVAILABLE_BAUD_RATES = [9600, 19200, 38400, 57600, 115200]
@@ -16,9 +18,24 @@ CSV_FILE = 'payload_log.csv'
 MOCK_UPDATE_INTERVAL = 1
 MOCK_REALISTIC_VARIATIONS = True  # Enable realistic sensor variations
 
+# Web server settings
+# Threading by default: the serial reads block, which would stall an
+# unpatched eventlet/gevent hub. Opt in with e.g. IOT_ASYNC_MODE=eventlet;
+# run.py reads the same variable to monkey-patch for eventlet/gevent.
+SOCKETIO_ASYNC_MODE = os.environ.get('IOT_ASYNC_MODE') or 'threading'
+
+# Per-packet Socket.IO/Engine.IO logging; enable with IOT_DEBUG=1
+DEBUG = os.environ.get('IOT_DEBUG') == '1'
+
+# Log level for the app; DEBUG adds per-tick reader output, WARNING keeps
+# only problems. Override with e.g. IOT_LOG_LEVEL=DEBUG
+LOG_LEVEL = (os.environ.get('IOT_LOG_LEVEL') or 'INFO').upper()
+
 # Dashboard settings
 MAX_CHART_POINTS = 50  # Maximum points to show on charts
+HISTORY_LENGTH = 100  # Samples kept for /api/history; memory is preallocated once
 UPDATE_FREQUENCY = 1000 
+PORT_SCAN_CACHE_TTL = 2.0  # Seconds to reuse the last serial port scan
 
 # GPS coordinate conversion settings
 DEFAULT_GPS_FORMAT = "DDMM.MMMMM"  # Format from your device
@@ -1,4 +1,7 @@
-from collections import defaultdict, deque
+from . import config
+from .utils import gps_to_decimal
+import numpy as np
+import operator
 import time
 
 # Latest sensor data with metadata - updated for new format
@@ -6,6 +9,7 @@ latest_data = {
     "lat": 3325.271972,        # GPS coordinates in DDMM.MMMMM format
     "lon": 11155.243164,
     "alt": 378.0,
+    "alt_calculated": False,   # True when alt comes from pressure, not GPS
     "satellites": 9,
     "utc_time": "22:42:36",
     "rtc_date": "8/2/2025",
@@ -18,11 +22,49 @@ latest_data = {
     "co2": 732.9,
     "thermal_temp": 26.04,
     "heating_status": "ON",
-    "target_range": "29.4 - 29.6"
+    "target_range": "29.4 - 29.6",
+    # Served as-is by /api/current, so kept current here rather than
+    # merged in per request
+    "source": "mock" if config.USE_MOCK else "device",
+    "status": "active"
 }
 
-# History for plotting (limited size for performance)
-history = defaultdict(lambda: deque(maxlen=100))
+# History for plotting. Sized once at import: old samples are overwritten in
+# place, so memory stays flat however long the reader runs.
+HISTORY_LENGTH = config.HISTORY_LENGTH
+
+# Numeric fields kept for charts, plus the sample timestamp. The schema of
+# latest_data is fixed, so the set of series is known up front.
+HISTORY_KEYS = ("time",) + tuple(
+    key for key, value in latest_data.items()
+    if isinstance(value, (int, float)) and not isinstance(value, bool)
+)
+
+# Row of each field in history_buffer
+HISTORY_COLUMNS = {key: i for i, key in enumerate(HISTORY_KEYS)}
+
+# Integer fields (e.g. satellites) are stored as float64 like the rest and
+# cast back when read, so /api/history keeps their JSON type
+HISTORY_INT_KEYS = frozenset(key for key in HISTORY_KEYS[1:] if isinstance(latest_data[key], int))
+
+# Fetches every charted field of latest_data in a single C-level call
+_history_fields = operator.itemgetter(*HISTORY_KEYS[1:])
+
+# One preallocated ring buffer for all fields, laid out as one contiguous row
+# per field (struct of arrays) so each chart series is read without a
+# transpose. float64 so epoch timestamps and DDMM.MMMMM coordinates keep
+# full precision.
+history_buffer = np.zeros((len(HISTORY_KEYS), HISTORY_LENGTH))
+history_head = 0   # Next column to write
+history_count = 0  # Number of filled slots
+
+# Bumped on every history append so readers can cache serialized output
+history_version = 0
+
+# Bumped (with the time) by every writer of latest_data, once its writes are
+# done, so /api/current can cache the serialized body
+data_version = 0
+data_modified = time.time()
 
 # System status
 system_status = {
@@ -37,30 +79,66 @@ def get_system_uptime():
     """Get system uptime in seconds"""
     return time.time() - system_status["uptime_start"]
 
+def mark_data_changed():
+    """Record that latest_data changed so cached copies are rebuilt"""
+    global data_version, data_modified
+    data_modified = time.time()
+    data_version += 1
+
 def update_system_status(source="mock", error=False):
     """Update system status"""
     system_status["last_update"] = time.time()
     system_status["data_source"] = source
+    latest_data["source"] = source
     if error:
         system_status["error_count"] += 1
         system_status["connection_status"] = "error"
     else:
         system_status["connection_status"] = "connected"
+    mark_data_changed()
+
+def append_history(timestamp):
+    """Append the current latest_data values to the history ring buffer"""
+    global history_head, history_count, history_version
+    
+    head = history_head
+    sample = history_buffer[:, head]
+    sample[0] = timestamp
+    sample[1:] = _history_fields(latest_data)
+    
+    history_head = (head + 1) % HISTORY_LENGTH
+    history_count = min(history_count + 1, HISTORY_LENGTH)
+    history_version += 1
+
+def get_history():
+    """Get history as {key: array} in chronological order (oldest first)"""
+    head, count = history_head, history_count
+    if count < HISTORY_LENGTH:
+        # Appends only write past count, so these row views stay stable
+        series = history_buffer[:, :count]
+    else:
+        series = np.concatenate((history_buffer[:, head:], history_buffer[:, :head]), axis=1)
+    # Each row slice is C-contiguous, as orjson requires
+    return {
+        key: series[i].astype(np.int64) if key in HISTORY_INT_KEYS else series[i]
+        for key, i in HISTORY_COLUMNS.items()
+    }
 
 def convert_gps_to_decimal(coord):
     """Convert DDMM.MMMMM format to decimal degrees"""
-    if coord == 0:
-        return 0
-    
-    degrees = int(coord / 100)
-    minutes = coord - (degrees * 100)
-    return degrees + (minutes / 60)
+    return gps_to_decimal(coord)
 
 def get_decimal_coordinates():
     """Get GPS coordinates in decimal format for display"""
     lat_decimal = convert_gps_to_decimal(latest_data["lat"])
-    lon_decimal = convert_gps_to_decimal(latest_data["lon"])
-    # Assuming longitude is West (negative)
-    if latest_data["lon"] > 10000:  # Likely a longitude > 100 degrees
-        lon_decimal = -lon_decimal
-    return lat_decimal, lon_decimal
\ No newline at end of file
+    # Longitude is West (negative), as in the CSV log and live updates
+    lon_decimal = 0.0 - convert_gps_to_decimal(latest_data["lon"])  # 0.0 - x avoids -0.0
+    return lat_decimal, lon_decimal
+
+def update_decimal_coordinates():
+    """Cache decimal GPS coordinates on latest_data, once per sensor tick"""
+    lat_decimal, lon_decimal = get_decimal_coordinates()
+    latest_data["lat_decimal"] = lat_decimal
+    latest_data["lon_decimal"] = lon_decimal
+
+update_decimal_coordinates()
\ No newline at end of file
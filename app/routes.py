@@ -1,10 +1,48 @@
-from flask import Blueprint, render_template, jsonify, request
-from .data_store import latest_data, history, get_decimal_coordinates
-from . import config
-import json
+from flask import Blueprint, Response, render_template, jsonify, request
+from .data_store import latest_data
+from . import config, data_store, socketio
+from .serial_reader import stop_reader, start_reader
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import gzip
+import logging
+import threading
+import orjson
+import re
+import time
+
+log = logging.getLogger(__name__)
 
 main = Blueprint('main', __name__)
 
+# Prefix for ETags so versions from a previous run never validate
+_ETAG_SEED = format(time.time_ns(), 'x')
+
+# Accepted serial port names: COMx (any case) or a /dev/ device path
+_PORT_RE = re.compile(r'(?P<com>(?i:com)\d+)|/dev/[\w./-]+')
+_BAUD_RATES = frozenset(config.AVAILABLE_BAUD_RATES)
+
+# Serialized /api/current body as (version, bytes); the data version is
+# bumped after every change to latest_data
+_current_cache = (-1, b"")
+
+# Serialized /api/history body as (version, raw, gzipped), reused until
+# the history version changes
+_history_cache = (-1, b"", b"")
+
+# Serialized /api/config body as (version, bytes), rebuilt after every POST
+_config_cache = (0, b"")
+
+# (monotonic time, ports) from the last comports() scan
+_ports_cache = (0.0, None)
+
+# Serial probes run here so a hung port driver can't hold a request thread
+_probe_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PortProbe")
+
+# Reader restarts run here, one at a time, so config POSTs return at once
+_reader_ctl = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ReaderControl")
+_restart_lock = threading.Lock()
+_pending_restart = None
+
 @main.route("/")
 def dashboard():
     """Serve the main dashboard"""
@@ -13,30 +51,61 @@ def dashboard():
 @main.route("/api/current")
 def get_current_data():
     """Get current sensor readings"""
-    lat_decimal, lon_decimal = get_decimal_coordinates()
+    global _current_cache
+    
+    version = data_store.data_version
+    cached_version, body = _current_cache
     
-    return jsonify({
-        **latest_data,
-        "lat_decimal": lat_decimal,
-        "lon_decimal": lon_decimal,
-        "source": "mock" if config.USE_MOCK else "device",
-        "status": "active"
-    })
+    if cached_version != version:
+        # Decimal coordinates and source are kept on latest_data by the reader
+        body = orjson.dumps(latest_data)
+        _current_cache = (version, body)
+    
+    # Last-Modified alone has 1 s resolution, too coarse for 1 Hz ticks;
+    # clients that also send If-None-Match get the exact ETag comparison
+    response = Response(body, mimetype='application/json')
+    response.last_modified = data_store.data_modified
+    response.set_etag(f"{_ETAG_SEED}-{version}", weak=True)
+    return response.make_conditional(request)
 
 @main.route("/api/history")
 def get_history():
     """Get historical data for charts"""
-    # Convert deques to lists for JSON serialization
-    history_data = {}
-    for key, values in history.items():
-        history_data[key] = list(values)
+    global _history_cache
+    
+    # Read the version first so a concurrent append only makes us rebuild
+    # again on the next request, never serve stale data as current
+    version = data_store.history_version
+    cached_version, body, gz_body = _history_cache
     
-    return jsonify(history_data)
+    if cached_version != version:
+        # orjson encodes the NumPy arrays directly, no per-float boxing
+        body = orjson.dumps(data_store.get_history(), option=orjson.OPT_SERIALIZE_NUMPY)
+        # Compress once per version rather than once per request
+        gz_body = gzip.compress(body, mtime=0)
+        _history_cache = (version, body, gz_body)
+    
+    if request.accept_encodings["gzip"]:
+        response = Response(gz_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    response.set_etag(f"{_ETAG_SEED}-{version}", weak=True)
+    return response.make_conditional(request)
 
 @main.route("/api/config")
 def get_config():
     """Get current configuration"""
-    return jsonify({
+    version, body = _config_cache
+    response = Response(body, mimetype='application/json')
+    response.set_etag(f"{_ETAG_SEED}-{version}", weak=True)
+    return response.make_conditional(request)
+
+def _rebuild_config_bytes():
+    """Re-serialize the /api/config payload from the current settings"""
+    global _config_cache
+    _config_cache = (_config_cache[0] + 1, orjson.dumps({
         "use_mock": config.USE_MOCK,
         "serial_port": config.SERIAL_PORT,
         "baud_rate": config.BAUD_RATE,
@@ -44,13 +113,50 @@ def get_config():
         "max_chart_points": config.MAX_CHART_POINTS,
         "update_frequency": config.UPDATE_FREQUENCY,
         "timeout": config.TIMEOUT
-    })
+    }))
+
+_rebuild_config_bytes()
 
 @main.route("/api/config", methods=['POST'])
 def update_config():
     """Update configuration (COM port, baud rate, mock/real mode)"""
-    data = request.get_json()
+    try:
+        response, restart_reader = _apply_config_update(request.get_json())
+    finally:
+        # Settings may have changed even when a later field was rejected
+        # or the update failed partway through
+        _rebuild_config_bytes()
+    
+    if restart_reader:
+        _schedule_reader_restart()
+        # Accepted only when the whole update applied; errors keep their body
+        if response.get_json()["status"] == "success":
+            response.status_code = 202
+    return response
+
+def _restart_reader():
+    """Stop the running reader and start one with the current settings"""
+    # Nothing waits on this task's result, so failures must be logged here
+    try:
+        stop_reader()
+        start_reader(socketio)
+    except Exception as e:
+        log.exception("❌ Reader restart failed: %s", e)
+
+def _schedule_reader_restart():
+    """Queue a reader restart unless one is already waiting to run"""
+    global _pending_restart
+    with _restart_lock:
+        # A queued restart that hasn't started will pick up the new settings
+        if _pending_restart is not None and not _pending_restart.running() and not _pending_restart.done():
+            return
+        _pending_restart = _reader_ctl.submit(_restart_reader)
+
+def _apply_config_update(data):
+    """Apply the posted settings; returns (response, restart_reader)"""
+    global _ports_cache
     response_messages = []
+    restart_reader = False
     
     # Handle data source toggle
     if 'use_mock' in data:
@@ -58,88 +164,96 @@ def update_config():
         config.USE_MOCK = data['use_mock']
         
         # Restart the data reader with new mode
-        from .serial_reader import stop_reader, start_reader
-        from . import socketio
+        log.info("🔄 Switching from %s to %s mode",
+                 'mock' if old_mode else 'device', 'mock' if config.USE_MOCK else 'device')
         
-        print(f"🔄 Switching from {'mock' if old_mode else 'device'} to {'mock' if config.USE_MOCK else 'device'} mode")
-        
-        stop_reader()
-        start_reader(socketio)
+        restart_reader = True
+        latest_data["source"] = 'mock' if config.USE_MOCK else 'device'
+        data_store.mark_data_changed()
         
         response_messages.append(f"Switched to {'mock' if config.USE_MOCK else 'device'} mode")
     
     # Handle COM port update
     if 'serial_port' in data:
         old_port = config.SERIAL_PORT
-        new_port = data['serial_port'].strip().upper()
+        # str() so a non-string value fails the format check below instead
+        # of raising after earlier fields were already applied
+        new_port = str(data['serial_port']).strip()
         
         # Validate COM port format
-        if not new_port.startswith('COM') and not new_port.startswith('/dev/'):
+        match = _PORT_RE.fullmatch(new_port)
+        if not match:
             return jsonify({
                 "status": "error", 
                 "message": "Invalid COM port format. Use COMx for Windows or /dev/ttyUSBx for Linux/Mac"
-            })
+            }), restart_reader
+        
+        # Windows port names are case-insensitive, device paths are not
+        if match['com']:
+            new_port = new_port.upper()
         
         config.SERIAL_PORT = new_port
-        print(f"📡 COM port updated from {old_port} to {new_port}")
+        log.info("📡 COM port updated from %s to %s", old_port, new_port)
+        
+        # Force a fresh port scan on the next request
+        _ports_cache = (0.0, None)
         
         # Restart reader if using device mode
         if not config.USE_MOCK:
-            from .serial_reader import stop_reader, start_reader
-            from . import socketio
-            
-            stop_reader()
-            start_reader(socketio)
+            restart_reader = True
         
         response_messages.append(f"COM port updated to {new_port}")
     
     # Handle baud rate update
     if 'baud_rate' in data:
         old_baud = config.BAUD_RATE
-        new_baud = int(data['baud_rate'])
+        try:
+            new_baud = int(data['baud_rate'])
+        except (TypeError, ValueError):
+            new_baud = None  # Rejected below like any unsupported rate
         
         # Validate baud rate
-        if new_baud not in config.AVAILABLE_BAUD_RATES:
+        if new_baud not in _BAUD_RATES:
             return jsonify({
                 "status": "error",
                 "message": f"Invalid baud rate. Available rates: {config.AVAILABLE_BAUD_RATES}"
-            })
+            }), restart_reader
         
         config.BAUD_RATE = new_baud
-        print(f"⚡ Baud rate updated from {old_baud} to {new_baud}")
+        log.info("⚡ Baud rate updated from %s to %s", old_baud, new_baud)
         
         # Restart reader if using device mode
         if not config.USE_MOCK:
-            from .serial_reader import stop_reader, start_reader
-            from . import socketio
-            
-            stop_reader()
-            start_reader(socketio)
+            restart_reader = True
         
         response_messages.append(f"Baud rate updated to {new_baud}")
     
     # Handle timeout update
     if 'timeout' in data:
         old_timeout = config.TIMEOUT
-        new_timeout = float(data['timeout'])
+        try:
+            new_timeout = float(data['timeout'])
+        except (TypeError, ValueError):
+            new_timeout = 0.0  # Rejected below like any out-of-range value
         
-        if new_timeout <= 0 or new_timeout > 10:
+        # Written as a range so NaN is rejected too
+        if not 0 < new_timeout <= 10:
             return jsonify({
                 "status": "error",
                 "message": "Timeout must be between 0.1 and 10 seconds"
-            })
+            }), restart_reader
         
         config.TIMEOUT = new_timeout
-        print(f"⏱️ Timeout updated from {old_timeout} to {new_timeout}")
+        log.info("⏱️ Timeout updated from %s to %s", old_timeout, new_timeout)
         response_messages.append(f"Timeout updated to {new_timeout}s")
     
     if response_messages:
         return jsonify({
             "status": "success", 
             "message": "; ".join(response_messages)
-        })
+        }), restart_reader
     
-    return jsonify({"status": "error", "message": "No valid configuration parameters provided"})
+    return jsonify({"status": "error", "message": "No valid configuration parameters provided"}), restart_reader
 
 @main.route("/api/test-connection")
 def test_connection():
@@ -153,7 +267,14 @@ def test_connection():
     
     try:
         import serial
-        
+    except ImportError:
+        return jsonify({
+            "status": "error",
+            "message": "pyserial not installed. Install with: pip install pyserial",
+            "connection": "missing_library"
+        })
+    
+    def probe():
         # Try to open the connection briefly
         test_conn = serial.Serial(
             config.SERIAL_PORT, 
@@ -161,6 +282,10 @@ def test_connection():
             timeout=1
         )
         test_conn.close()
+    
+    future = _probe_pool.submit(probe)
+    try:
+        future.result(timeout=config.PORT_PROBE_TIMEOUT)
         
         return jsonify({
             "status": "success",
@@ -168,18 +293,19 @@ def test_connection():
             "connection": "device"
         })
         
+    except FutureTimeoutError:
+        future.cancel()
+        return jsonify({
+            "status": "error",
+            "message": f"Timed out opening {config.SERIAL_PORT} after {config.PORT_PROBE_TIMEOUT}s",
+            "connection": "timeout"
+        }), 504
     except serial.SerialException as e:
         return jsonify({
             "status": "error",
             "message": f"Failed to connect to {config.SERIAL_PORT}: {str(e)}",
             "connection": "failed"
         })
-    except ImportError:
-        return jsonify({
-            "status": "error",
-            "message": "pyserial not installed. Install with: pip install pyserial",
-            "connection": "missing_library"
-        })
     except Exception as e:
         return jsonify({
             "status": "error",
@@ -190,6 +316,17 @@ def test_connection():
 @main.route("/api/available-ports")
 def get_available_ports():
     """Get list of available COM ports"""
+    global _ports_cache
+    
+    # Port enumeration is slow (registry/SetupAPI on Windows), so reuse a
+    # recent scan when the UI polls repeatedly
+    scanned_at, ports = _ports_cache
+    if ports is not None and time.monotonic() - scanned_at < config.PORT_SCAN_CACHE_TTL:
+        return jsonify({
+            "status": "success",
+            "ports": ports
+        })
+    
     try:
         import serial.tools.list_ports
         
@@ -200,6 +337,7 @@ def get_available_ports():
                 "description": port_info.description,
                 "hwid": port_info.hwid
             })
+        _ports_cache = (time.monotonic(), ports)
         
         return jsonify({
             "status": "success",
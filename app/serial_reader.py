@@ -1,43 +1,142 @@
 import threading
-import random
+import logging
+import queue
 import time
 import csv
-import json
-import math
+from collections import ChainMap
+import operator
 import re
 from datetime import datetime
-from .data_store import latest_data, history, update_system_status
-from . import config
+import numpy as np
+from .data_store import latest_data, update_system_status, append_history, update_decimal_coordinates
+from .utils import barometric_altitude, mock_baselines
+from . import config, broadcast_sensor_update
+
+log = logging.getLogger(__name__)
 
 try:
     import serial
     import serial.tools.list_ports
 except ImportError:
-    print("⚠️  pyserial not installed. Install with: pip install pyserial")
+    log.warning("⚠️  pyserial not installed. Install with: pip install pyserial")
     serial = None
 
+# One pattern covering every telemetry line of a block. Each alternative is
+# anchored at a line start and names the latest_data field it sets, so a
+# single finditer pass over the raw block replaces per-line matching.
+# [^\S\n] is whitespace that can't run onto the next line; it also absorbs
+# the \r of CRLF endings, so blank lines and indentation need no per-line
+# split() or strip(). It is a bytes pattern, so blocks are parsed straight from
+# the serial buffer without decoding them first.
+_BLOCK_RE = re.compile(
+    rb'^[^\S\n]*(?:'
+    rb'(?P<gps_no_fix>GPS:[^\n]*No Fix)'
+    # GPS: 3325.271972, 11155.243164 (Alt: 378.0 m)
+    rb'|(?P<gps>GPS:[^\S\n]*(?P<gps_lat>[\d.]+),[^\S\n]*(?P<gps_lon>[\d.]+)[^\S\n]*'
+    rb'\(Alt:[^\S\n]*(?P<gps_alt>[\d.]+)[^\S\n]*m\))'
+    rb'|Sats:[^\S\n]*(?P<satellites>\d+)'
+    rb'|UTC Time:[^\S\n]*(?P<utc_time>[\d:]+)'
+    rb'|RTC Date:[^\S\n]*(?P<rtc_date>[\d/]+)'
+    rb'|RTC Time:[^\S\n]*(?P<rtc_time>[\d:]+)'
+    rb'|MS5611 Temp:[^\S\n]*(?P<ms5611_temp>[\d.-]+)'
+    rb'|Pressure:[^\S\n]*(?P<pressure>[\d.-]+)'
+    # DS18B20 Temp: 25.62 °C (78.12 °F)
+    rb'|DS18B20 Temp:[^\S\n]*(?P<ds18b20_temp>[\d.-]+)'
+    rb'|SCD30 Temp:[^\S\n]*(?P<scd30_temp>[\d.-]+)'
+    rb'|Humidity:[^\S\n]*(?P<rh>[\d.-]+)'
+    rb'|CO2:[^\S\n]*(?P<co2>[\d.-]+)'
+    # Thermal Temp: 26.04 °C (78.87 °F)
+    rb'|Thermal Temp:[^\S\n]*(?P<thermal_temp>[\d.-]+)'
+    rb'|Heating Status:[^\S\n]*(?P<heating_status>\w+)'
+    rb'|Target Range:[^\S\n]*(?P<target_range>[\d.-]+ - [\d.-]+)'
+    rb')',
+    re.MULTILINE
+)
+
+# Type of each single-value field captured by _BLOCK_RE
+_FIELD_CASTS = {
+    'satellites': int,  # May be 0 when no GPS fix
+    'utc_time': bytes.decode,
+    'rtc_date': bytes.decode,
+    'rtc_time': bytes.decode,
+    'ms5611_temp': float,
+    'pressure': float,
+    'ds18b20_temp': float,
+    'scd30_temp': float,
+    'rh': float,
+    'co2': float,
+    'thermal_temp': float,
+    'heating_status': bytes.decode,
+    'target_range': bytes.decode,
+}
+
+# Half-width of the uniform noise on each mock reading, in the order: shared
+# temperature, MS5611, DS18B20, SCD30, thermal, pressure, humidity, CO2
+_MOCK_NOISE = np.array([0.3, 1, 0.8, 0.6, 0.5, 2, 5, 30])
+_MOCK_BATCH = 1024  # Mock ticks of noise drawn per refill
+
+# Line that ends every telemetry block from the device
+BLOCK_TERMINATOR = b"=========================="
+
+# Column order of the CSV log, matching the rows written by log_data_to_csv
+CSV_HEADER = [
+    'timestamp', 'lat_decimal', 'lon_decimal', 'lat_raw', 'lon_raw', 
+    'alt', 'alt_calculated', 'satellites', 'utc_time', 'rtc_date', 'rtc_time', 
+    'ms5611_temp', 'pressure', 'ds18b20_temp', 'scd30_temp', 
+    'rh', 'co2', 'thermal_temp', 'heating_status', 'target_range'
+]
+
+# One CSV line. Every field is a number, bool or a parser-captured token
+# ([\d:/.-], \w+) that never needs quoting, so plain %s formatting matches
+# csv.writer's output ("\r\n" terminator included) without its per-cell checks.
+_CSV_ROW_FORMAT = ",".join(["%s"] * len(CSV_HEADER)) + "\r\n"
+
+# latest_data values for the CSV columns after the timestamp
+_csv_fields = operator.itemgetter(
+    'lat_decimal', 'lon_decimal', 'lat', 'lon', 'alt', 'alt_calculated', 'satellites', 'utc_time', 'rtc_date', 'rtc_time',
+    'ms5611_temp', 'pressure', 'ds18b20_temp', 'scd30_temp',
+    'rh', 'co2', 'thermal_temp', 'heating_status', 'target_range'
+)
+
 class DataReader:
     def __init__(self, socketio):
         self.socketio = socketio
         self.running = False
+        # Event type matches the async mode (threading, eventlet or gevent)
+        self.stop_event = socketio.server.eio.create_event()
         self.serial_conn = None
+        self.reconnect_at = 0.0     # Earliest time to retry a failed port open
+        self.reconnect_delay = 1.0  # Doubles after each failed open, up to 30 s
         self.start_time = time.time()
-        self.data_buffer = ""
+        self.data_buffer = bytearray()
+        self.mock_rng = np.random.default_rng()
+        self.mock_noise = []  # Pre-drawn noise rows, one consumed per mock tick
+        self.scan_offset = 0  # data_buffer before this holds no terminator
+        
+        # Thermal target for mock data; a restarted reader picks up new config
+        self.target_temp = (config.THERMAL_TARGET_MIN + config.THERMAL_TARGET_MAX) / 2
+        self.target_range = f"{config.THERMAL_TARGET_MIN} - {config.THERMAL_TARGET_MAX}"
         
-        # Initialize CSV with headers if file doesn't exist
+        # Keep one buffered handle open for the reader's lifetime instead of
+        # reopening the file every tick; flushed after every batch write
         try:
-            with open(config.CSV_FILE, 'x', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'lat_decimal', 'lon_decimal', 'lat_raw', 'lon_raw', 
-                    'alt', 'alt_calculated', 'satellites', 'utc_time', 'rtc_date', 'rtc_time', 
-                    'ms5611_temp', 'pressure', 'ds18b20_temp', 'scd30_temp', 
-                    'rh', 'co2', 'thermal_temp', 'heating_status', 'target_range'
-                ])
-        except FileExistsError:
-            pass
+            self.csv_file = open(config.CSV_FILE, 'a', newline='', buffering=1 << 16)
+            # Append mode starts at the end, so position 0 means a new or empty file
+            if self.csv_file.tell() == 0:
+                csv.writer(self.csv_file).writerow(CSV_HEADER)
+        except OSError as e:
+            # A locked or unwritable log must not stop live telemetry
+            log.error("❌ CSV logging error, running without %s: %s", config.CSV_FILE, e)
+            self.csv_file = None
         
-        print(f"✅ DataReader initialized with socketio: {socketio}")
+        # Rows are written by a dedicated thread so disk I/O never delays
+        # the timed reader loop; None on the queue stops the writer
+        self.csv_queue = queue.SimpleQueue()
+        self.csv_thread = threading.Thread(target=self.csv_worker, name="csv-writer", daemon=True)
+        if self.csv_file:
+            self.csv_thread.start()
+        
+        log.info("✅ DataReader initialized with socketio: %s", socketio)
 
     def calculate_altitude_from_pressure(self, pressure_mb, temperature_c, sea_level_pressure=1013.25):
         """
@@ -52,229 +151,128 @@ class DataReader:
             Altitude in meters
         """
         try:
-            # Convert temperature to Kelvin
-            T_kelvin = temperature_c + 273.15
-            
-            # Barometric formula: h = ((P0/P)^(1/5.257) - 1) * (T + 273.15) / 0.0065
-            pressure_ratio = sea_level_pressure / pressure_mb
-            altitude = ((pressure_ratio ** (1/5.257)) - 1) * T_kelvin / 0.0065
-            
-            return round(altitude, 1)
+            # Compiled with numba when it is installed
+            return barometric_altitude(pressure_mb, temperature_c, sea_level_pressure)
             
         except Exception as e:
-            print(f"❌ Error calculating altitude: {e}")
+            log.error("❌ Error calculating altitude: %s", e)
             return 0.0
 
     def format_date_windows_compatible(self, dt):
         """Format date in M/D/YYYY format (Windows compatible)"""
-        # Use %m/%d/%Y and then strip leading zeros manually
-        formatted = dt.strftime("%m/%d/%Y")
-        # Remove leading zeros from month and day
-        parts = formatted.split('/')
-        month = str(int(parts[0]))  # Remove leading zero from month
-        day = str(int(parts[1]))    # Remove leading zero from day  
-        year = parts[2]
-        return f"{month}/{day}/{year}"
+        # Integer fields have no leading zeros, and this avoids the
+        # platform-specific %-m / %#m strftime flags
+        return f"{dt.month}/{dt.day}/{dt.year}"
 
-    def generate_realistic_mock_data(self):
+    def generate_realistic_mock_data(self, now=None):
         """Generate realistic mock data matching your device format"""
-        current_time = time.time()
+        if now is None:
+            now = datetime.now()
+        current_time = now.timestamp()
         elapsed = current_time - self.start_time
         
-        # Time-based variations for realistic sensor behavior
-        time_factor = math.sin(elapsed / 60) * 0.5 + 0.5  # Slow sine wave
-        daily_factor = math.sin(elapsed / 3600) * 0.3 + 0.7  # Daily variation
+        # Noise comes from a batch drawn in one NumPy call per _MOCK_BATCH ticks
+        if not self.mock_noise:
+            draws = self.mock_rng.uniform(-1, 1, (_MOCK_BATCH, len(_MOCK_NOISE)))
+            self.mock_noise = (draws * _MOCK_NOISE).tolist()
+        (shared_noise, ms5611_noise, ds18b20_noise, scd30_noise,
+         thermal_noise, pressure_noise, rh_noise, co2_noise) = self.mock_noise.pop()
         
-        # GPS coordinates in DDMM.MMMMM format (like your device) - set to 0 when no GPS
-        latest_data["lat"] = 0.0  # No GPS fix
-        latest_data["lon"] = 0.0  # No GPS fix
-        latest_data["satellites"] = 0  # No satellites when no GPS
+        # Time-based variations for realistic sensor behavior, computed in
+        # one (numba-compiled when available) call; noise is added below
+        base_temp, thermal_base, pressure_base, humidity_base, co2_base = mock_baselines(elapsed)
         
         # Temperature sensors with realistic correlations
-        base_temp = 25 + daily_factor * 5  # 20-30°C range
-        temp_noise = random.uniform(-0.3, 0.3)
-        
-        latest_data["ms5611_temp"] = round(base_temp + temp_noise + random.uniform(-1, 1), 2)
-        latest_data["ds18b20_temp"] = round(base_temp + temp_noise + random.uniform(-0.8, 0.8), 2)
-        latest_data["scd30_temp"] = round(base_temp + temp_noise + random.uniform(-0.6, 0.6), 2)
-        latest_data["thermal_temp"] = round(26.04 + math.sin(elapsed / 200) * 2 + random.uniform(-0.5, 0.5), 2)
+        shared_temp = base_temp + shared_noise  # Noise common to all sensors
+        ms5611_temp = round(shared_temp + ms5611_noise, 2)
+        thermal_temp = round(thermal_base + thermal_noise, 2)
         
         # Pressure with realistic atmospheric variations
-        base_pressure = 968.15 + math.sin(elapsed / 300) * 5 + random.uniform(-2, 2)
-        latest_data["pressure"] = round(base_pressure, 2)
-        
-        # Calculate altitude from pressure using MS5611 temperature
-        calculated_alt = self.calculate_altitude_from_pressure(
-            latest_data["pressure"], 
-            latest_data["ms5611_temp"]
-        )
-        latest_data["alt"] = calculated_alt
-        latest_data["alt_calculated"] = True  # Flag to indicate calculated altitude
-        
-        # Time data - Windows compatible formatting
-        now = datetime.now()
-        latest_data["utc_time"] = "00:00:00"  # No GPS time
-        latest_data["rtc_date"] = self.format_date_windows_compatible(now)
-        latest_data["rtc_time"] = now.strftime("%H:%M:%S")
-        
-        # Humidity with inverse temperature correlation
-        base_humidity = 50 - (base_temp - 25) * 1.5
-        latest_data["rh"] = round(max(20, min(80, base_humidity + random.uniform(-5, 5))), 2)
+        pressure = round(pressure_base + pressure_noise, 2)
         
-        # CO2 with realistic atmospheric variations
-        co2_base = 700 + math.sin(elapsed / 600) * 150 + math.sin(elapsed / 60) * 20
-        latest_data["co2"] = round(max(400, min(1200, co2_base + random.uniform(-30, 30))), 1)
+        # Every field is computed first and stored with one update, so
+        # readers never see a half-written sample
+        latest_data.update({
+            # GPS coordinates in DDMM.MMMMM format (like your device) - set to 0 when no GPS
+            "lat": 0.0,
+            "lon": 0.0,
+            "satellites": 0,
+            "ms5611_temp": ms5611_temp,
+            "ds18b20_temp": round(shared_temp + ds18b20_noise, 2),
+            "scd30_temp": round(shared_temp + scd30_noise, 2),
+            "thermal_temp": thermal_temp,
+            "pressure": pressure,
+            # Altitude from pressure using MS5611 temperature
+            "alt": self.calculate_altitude_from_pressure(pressure, ms5611_temp),
+            "alt_calculated": True,
+            # Time data - Windows compatible formatting; no GPS time
+            "utc_time": "00:00:00",
+            "rtc_date": self.format_date_windows_compatible(now),
+            "rtc_time": f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
+            # Humidity with inverse temperature correlation
+            "rh": round(max(20, min(80, humidity_base + rh_noise)), 2),
+            # CO2 with realistic atmospheric variations
+            "co2": round(max(400, min(1200, co2_base + co2_noise)), 1),
+            # Thermal system logic
+            "heating_status": "ON" if thermal_temp < self.target_temp else "OFF",
+            "target_range": self.target_range,
+        })
         
-        # Thermal system logic
-        target_temp = (config.THERMAL_TARGET_MIN + config.THERMAL_TARGET_MAX) / 2
-        latest_data["heating_status"] = "ON" if latest_data["thermal_temp"] < target_temp else "OFF"
-        latest_data["target_range"] = f"{config.THERMAL_TARGET_MIN} - {config.THERMAL_TARGET_MAX}"
-        
-        print(f"📊 Generated mock data: No GPS, Pressure={latest_data['pressure']}mbar, Calculated Alt={latest_data['alt']}m, CO2={latest_data['co2']}ppm")
+        log.debug("📊 Generated mock data: No GPS, Pressure=%smbar, Calculated Alt=%sm, CO2=%sppm",
+                  latest_data['pressure'], latest_data['alt'], latest_data['co2'])
 
     def parse_telemetry_block(self, data_block):
-        """Parse a complete telemetry data block"""
+        """Parse a complete telemetry data block (raw bytes from the serial buffer)"""
         try:
-            lines = data_block.strip().split('\n')
-            data_updated = False
+            # Collect the block's fields first and store them with one update,
+            # so readers never see a half-written sample
+            parsed = {}
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
+            for match in _BLOCK_RE.finditer(data_block):
+                field = match.lastgroup
                 
                 # GPS coordinates and altitude - check for "No Fix"
-                if line.startswith('GPS:'):
-                    if "No Fix" in line:
-                        latest_data["lat"] = 0.0
-                        latest_data["lon"] = 0.0
-                        latest_data["alt"] = 0.0  # Will be calculated from pressure
-                        latest_data["satellites"] = 0
-                        data_updated = True
-                        print("📡 GPS: No Fix - will calculate altitude from pressure")
-                    else:
-                        # GPS: 3325.271972, 11155.243164 (Alt: 378.0 m)
-                        gps_pattern = r'GPS:\s*([\d.]+),\s*([\d.]+)\s*\(Alt:\s*([\d.]+)\s*m\)'
-                        match = re.search(gps_pattern, line)
-                        if match:
-                            latest_data["lat"] = float(match.group(1))
-                            latest_data["lon"] = float(match.group(2))
-                            latest_data["alt"] = float(match.group(3))
-                            latest_data["alt_calculated"] = False  # GPS altitude
-                            data_updated = True
-                
-                # Satellites (may be 0 when no GPS fix)
-                elif line.startswith('Sats:'):
-                    match = re.search(r'Sats:\s*(\d+)', line)
-                    if match:
-                        latest_data["satellites"] = int(match.group(1))
-                        data_updated = True
-                
-                # UTC Time
-                elif line.startswith('UTC Time:'):
-                    match = re.search(r'UTC Time:\s*([\d:]+)', line)
-                    if match:
-                        latest_data["utc_time"] = match.group(1)
-                        data_updated = True
-                
-                # RTC Date
-                elif line.startswith('RTC Date:'):
-                    match = re.search(r'RTC Date:\s*([\d/]+)', line)
-                    if match:
-                        latest_data["rtc_date"] = match.group(1)
-                        data_updated = True
-                
-                # RTC Time
-                elif line.startswith('RTC Time:'):
-                    match = re.search(r'RTC Time:\s*([\d:]+)', line)
-                    if match:
-                        latest_data["rtc_time"] = match.group(1)
-                        data_updated = True
-                
-                # MS5611 Temperature
-                elif line.startswith('MS5611 Temp:'):
-                    match = re.search(r'MS5611 Temp:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["ms5611_temp"] = float(match.group(1))
-                        data_updated = True
-                
-                # Pressure
-                elif line.startswith('Pressure:'):
-                    match = re.search(r'Pressure:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["pressure"] = float(match.group(1))
-                        data_updated = True
-                
-                # DS18B20 Temperature
-                elif line.startswith('DS18B20 Temp:'):
-                    # DS18B20 Temp: 25.62 °C (78.12 °F)
-                    match = re.search(r'DS18B20 Temp:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["ds18b20_temp"] = float(match.group(1))
-                        data_updated = True
-                
-                # SCD30 Temperature
-                elif line.startswith('SCD30 Temp:'):
-                    match = re.search(r'SCD30 Temp:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["scd30_temp"] = float(match.group(1))
-                        data_updated = True
-                
-                # Humidity
-                elif line.startswith('Humidity:'):
-                    match = re.search(r'Humidity:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["rh"] = float(match.group(1))
-                        data_updated = True
-                
-                # CO2
-                elif line.startswith('CO2:'):
-                    match = re.search(r'CO2:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["co2"] = float(match.group(1))
-                        data_updated = True
-                
-                # Thermal Temperature
-                elif line.startswith('Thermal Temp:'):
-                    # Thermal Temp: 26.04 °C (78.87 °F)
-                    match = re.search(r'Thermal Temp:\s*([\d.-]+)', line)
-                    if match:
-                        latest_data["thermal_temp"] = float(match.group(1))
-                        data_updated = True
-                
-                # Heating Status
-                elif line.startswith('Heating Status:'):
-                    match = re.search(r'Heating Status:\s*(\w+)', line)
-                    if match:
-                        latest_data["heating_status"] = match.group(1)
-                        data_updated = True
-                
-                # Target Range
-                elif line.startswith('Target Range:'):
-                    match = re.search(r'Target Range:\s*([\d.-]+ - [\d.-]+)', line)
-                    if match:
-                        latest_data["target_range"] = match.group(1)
-                        data_updated = True
+                if field == 'gps_no_fix':
+                    parsed["lat"] = 0.0
+                    parsed["lon"] = 0.0
+                    parsed["alt"] = 0.0  # Will be calculated from pressure
+                    parsed["satellites"] = 0
+                    log.debug("📡 GPS: No Fix - will calculate altitude from pressure")
+                elif field == 'gps':
+                    parsed["lat"] = float(match['gps_lat'])
+                    parsed["lon"] = float(match['gps_lon'])
+                    parsed["alt"] = float(match['gps_alt'])
+                    parsed["alt_calculated"] = False  # GPS altitude
+                else:
+                    parsed[field] = _FIELD_CASTS[field](match[field])
+            data_updated = bool(parsed)
             
             # After parsing all data, calculate altitude from pressure if no GPS altitude
-            if data_updated and (latest_data.get("lat", 0) == 0 or latest_data.get("alt", 0) == 0):
-                if "pressure" in latest_data and "ms5611_temp" in latest_data:
+            if data_updated:
+                # Fields missing from this block keep their latest values
+                current = ChainMap(parsed, latest_data)
+                if current["lat"] == 0 or current["alt"] == 0:
                     calculated_alt = self.calculate_altitude_from_pressure(
-                        latest_data["pressure"], 
-                        latest_data["ms5611_temp"]
+                        current["pressure"], 
+                        current["ms5611_temp"]
                     )
-                    latest_data["alt"] = calculated_alt
-                    latest_data["alt_calculated"] = True
-                    print(f"🧮 Calculated altitude: {calculated_alt}m from pressure {latest_data['pressure']}mbar at {latest_data['ms5611_temp']}°C")
+                    parsed["alt"] = calculated_alt
+                    parsed["alt_calculated"] = True
+                    log.debug("🧮 Calculated altitude: %sm from pressure %smbar at %s°C",
+                              calculated_alt, current['pressure'], current['ms5611_temp'])
+                
+                latest_data.update(parsed)
             
-            if data_updated:
+            if data_updated and log.isEnabledFor(logging.DEBUG):
                 alt_source = "calculated" if latest_data.get("alt_calculated", False) else "GPS"
-                print(f"📡 Parsed telemetry: GPS=({latest_data.get('lat', 'N/A')}, {latest_data.get('lon', 'N/A')}), Alt={latest_data.get('alt', 'N/A')}m ({alt_source}), CO2={latest_data.get('co2', 'N/A')}ppm")
+                log.debug("📡 Parsed telemetry: GPS=(%s, %s), Alt=%sm (%s), CO2=%sppm",
+                          latest_data.get('lat', 'N/A'), latest_data.get('lon', 'N/A'),
+                          latest_data.get('alt', 'N/A'), alt_source, latest_data.get('co2', 'N/A'))
             
             return data_updated
                     
         except Exception as e:
-            print(f"❌ Error parsing telemetry data: {e}")
+            log.error("❌ Error parsing telemetry data: %s", e)
             return False
 
     def read_serial_data(self):
@@ -282,73 +280,40 @@ class DataReader:
         try:
             if not self.serial_conn:
                 if not serial:
-                    print("❌ pyserial not available")
+                    log.error("❌ pyserial not available")
+                    return False
+                
+                # Reconnect without the start-up settle delay: partial blocks
+                # from a resetting device are dropped by the framing anyway
+                if time.time() < self.reconnect_at or not self.connect_serial():
                     return False
-                    
-                print(f"📡 Attempting to connect to {config.SERIAL_PORT} at {config.BAUD_RATE} baud...")
-                self.serial_conn = serial.Serial(
-                    config.SERIAL_PORT, 
-                    config.BAUD_RATE, 
-                    timeout=config.TIMEOUT
-                )
-                time.sleep(2)  # Give device time to initialize
-                print(f"✅ Connected to {config.SERIAL_PORT}")
             
-            # Read data with buffering
+            # Read data with buffering. Bytes are accumulated in a bytearray and
+            # complete blocks are parsed as bytes.
             start_time = time.time()
-            new_data = ""
             
             while time.time() - start_time < 5:  # Read for up to 5 seconds
-                if self.serial_conn.in_waiting > 0:
-                    try:
-                        chunk = self.serial_conn.read(self.serial_conn.in_waiting).decode('utf-8', errors='ignore')
-                        new_data += chunk
-                        self.data_buffer += chunk
-                        
-                        # Look for complete telemetry blocks
-                        if ("GPS:" in self.data_buffer and "Target Range:" in self.data_buffer) or \
-                           ("==========================" in self.data_buffer):
-                            # Extract a complete block of data
-                            lines = self.data_buffer.split('\n')
-                            
-                            # Find start and end of a complete data block
-                            start_idx = -1
-                            end_idx = -1
-                            
-                            for i, line in enumerate(lines):
-                                if line.strip().startswith('GPS:'):
-                                    start_idx = i
-                                elif line.strip() == "==========================":
-                                    end_idx = i
-                                    break
-                            
-                            if start_idx != -1 and end_idx != -1:
-                                block_lines = lines[start_idx:end_idx+1]
-                                block = '\n'.join(block_lines)
-                                
-                                # Remove processed data from buffer
-                                remaining_lines = lines[end_idx+1:]
-                                self.data_buffer = '\n'.join(remaining_lines)
-                                
-                                # Parse the complete block
-                                if block.strip():
-                                    return self.parse_telemetry_block(block)
-                        
-                        # Prevent buffer from getting too large
-                        if len(self.data_buffer) > 2000:
-                            self.data_buffer = self.data_buffer[-1000:]  
-                            
-                    except UnicodeDecodeError:
-                        print("⚠️ Unicode decode error, skipping chunk")
-                        continue
-                        
-                else:
-                    time.sleep(0.1)
+                # A previous read may already hold a complete block
+                block = self.take_buffered_block()
+                if block:
+                    return self.parse_telemetry_block(block)
+                
+                # Take everything the driver already holds in one read; when
+                # it is empty, block for the next byte up to the port timeout
+                # (config.TIMEOUT). pyserial's read_until fetches one byte per
+                # call, so it is avoided here.
+                self.data_buffer += self.serial_conn.read(self.serial_conn.in_waiting or 1)
+                
+                # Prevent buffer from getting too large
+                if len(self.data_buffer) > 2000 and self.data_buffer.find(BLOCK_TERMINATOR, self.scan_offset) == -1:
+                    trimmed = len(self.data_buffer) - 1000
+                    del self.data_buffer[:trimmed]
+                    self.scan_offset = max(0, self.scan_offset - trimmed)
             
             return False
             
         except serial.SerialException as e:
-            print(f"❌ Serial error: {e}")
+            log.error("❌ Serial error: %s", e)
             if self.serial_conn:
                 try:
                     self.serial_conn.close()
@@ -358,186 +323,241 @@ class DataReader:
             update_system_status("device", error=True)
             return False
         except Exception as e:
-            print(f"❌ Unexpected error in serial reading: {e}")
+            log.error("❌ Unexpected error in serial reading: %s", e)
             return False
 
-    def convert_gps_to_decimal(self, coord):
-        """Convert DDMM.MMMMM format to decimal degrees"""
-        if coord == 0:
-            return 0
+    def connect_serial(self):
+        """Open the serial port, backing off after failed attempts"""
+        log.info("📡 Attempting to connect to %s at %s baud...", config.SERIAL_PORT, config.BAUD_RATE)
+        try:
+            self.serial_conn = serial.Serial(
+                config.SERIAL_PORT, 
+                config.BAUD_RATE, 
+                timeout=config.TIMEOUT
+            )
+        except serial.SerialException as e:
+            log.error("❌ Serial error: %s (retrying in %.0fs)", e, self.reconnect_delay)
+            self.reconnect_at = time.time() + self.reconnect_delay
+            self.reconnect_delay = min(self.reconnect_delay * 2, 30.0)
+            update_system_status("device", error=True)
+            return False
         
-        degrees = int(coord / 100)
-        minutes = coord - (degrees * 100)
-        return degrees + (minutes / 60)
+        self.reconnect_delay = 1.0
+        log.info("✅ Connected to %s", config.SERIAL_PORT)
+        return True
+
+    def take_buffered_block(self):
+        """Remove the first complete block from the buffer and return its bytes"""
+        # A block runs from its GPS line to the terminator line. Resume the
+        # search where the last one failed so buffered bytes are scanned once.
+        end_idx = self.data_buffer.find(BLOCK_TERMINATOR, self.scan_offset)
+        if end_idx == -1:
+            # A terminator may still be split across the end of the buffer
+            self.scan_offset = max(0, len(self.data_buffer) - len(BLOCK_TERMINATOR) + 1)
+            return None
+        
+        end_idx += len(BLOCK_TERMINATOR)
+        start_idx = self.data_buffer.rfind(b"GPS:", 0, end_idx)
+        block = self.data_buffer[start_idx:end_idx] if start_idx != -1 else None
+        
+        # Remove processed data from buffer, including a partial block that
+        # had no GPS line
+        del self.data_buffer[:end_idx]
+        self.scan_offset = 0
+        return block
 
     def log_data_to_csv(self, timestamp):
-        """Log current data to CSV file with decimal GPS coordinates"""
-        try:
-            # Convert GPS to decimal
-            lat_decimal = self.convert_gps_to_decimal(latest_data.get("lat", 0))
-            lon_decimal = -self.convert_gps_to_decimal(latest_data.get("lon", 0))  # Assuming West longitude
+        """Queue the current data, with decimal GPS coordinates, for the CSV log"""
+        if self.csv_file is None:
+            return
+        # Snapshot the row now; latest_data changes on the next tick
+        self.csv_queue.put((timestamp,) + _csv_fields(latest_data))
+
+    def csv_worker(self):
+        """Write queued CSV rows until a None sentinel arrives"""
+        get = self.csv_queue.get
+        stopping = False
+        
+        while not stopping:
+            rows = [get()]
+            # Drain whatever else is waiting into the same write
+            while len(rows) < 64 and not self.csv_queue.empty():
+                rows.append(get())
             
-            with open(config.CSV_FILE, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    timestamp,
-                    lat_decimal,
-                    lon_decimal,
-                    latest_data.get("lat", ""),
-                    latest_data.get("lon", ""),
-                    latest_data.get("alt", ""),
-                    latest_data.get("alt_calculated", False),  # New field
-                    latest_data.get("satellites", ""),
-                    latest_data.get("utc_time", ""),
-                    latest_data.get("rtc_date", ""),
-                    latest_data.get("rtc_time", ""),
-                    latest_data.get("ms5611_temp", ""),
-                    latest_data.get("pressure", ""),
-                    latest_data.get("ds18b20_temp", ""),
-                    latest_data.get("scd30_temp", ""),
-                    latest_data.get("rh", ""),
-                    latest_data.get("co2", ""),
-                    latest_data.get("thermal_temp", ""),
-                    latest_data.get("heating_status", ""),
-                    latest_data.get("target_range", "")
-                ])
-        except Exception as e:
-            print(f"❌ CSV logging error: {e}")
+            # A tick still in progress when stop() runs can queue a row
+            # after the sentinel, so look for it anywhere in the batch
+            if None in rows:
+                rows = [row for row in rows if row is not None]
+                stopping = True
+            
+            try:
+                self.csv_file.write("".join([_CSV_ROW_FORMAT % row for row in rows]))
+                # Off the tick thread, so flushing each batch costs the
+                # reader nothing and a crash loses at most this batch
+                self.csv_file.flush()
+            except Exception as e:
+                log.error("❌ CSV logging error: %s", e)
 
     def update_history(self, timestamp):
-        """Update history deques for charting"""
-        history["time"].append(timestamp)
-        for key, value in latest_data.items():
-            if isinstance(value, (int, float)):  # Only numeric values for charts
-                history[key].append(value)
+        """Update history ring buffers for charting"""
+        append_history(timestamp)
 
     def emit_data(self, timestamp):
         """Emit data via WebSocket"""
         try:
-            # Add decimal GPS coordinates for frontend
-            lat_decimal = self.convert_gps_to_decimal(latest_data.get("lat", 0))
-            lon_decimal = -self.convert_gps_to_decimal(latest_data.get("lon", 0))  # West longitude
-            
-            data_to_send = {
-                **latest_data, 
-                "lat_decimal": lat_decimal,
-                "lon_decimal": lon_decimal,
-                "timestamp": timestamp, 
-                "source": "mock" if config.USE_MOCK else "device"
-            }
-            
-            alt_source = "calculated" if latest_data.get("alt_calculated", False) else "GPS"
-            print(f"🚀 Emitting data: GPS=({lat_decimal:.4f}, {lon_decimal:.4f}), Alt={data_to_send.get('alt', 'N/A')}m ({alt_source}), CO2={data_to_send.get('co2', 'N/A')}ppm")
-            self.socketio.emit("new_data", data_to_send)
-            print(f"✅ Data emitted successfully")
+            # latest_data already carries decimal GPS, timestamp and source;
+            # orjson serializes it during emit, so no per-tick copy is needed
+            if log.isEnabledFor(logging.DEBUG):
+                alt_source = "calculated" if latest_data.get("alt_calculated", False) else "GPS"
+                log.debug("🚀 Emitting data: GPS=(%.4f, %.4f), Alt=%sm (%s), CO2=%sppm",
+                          latest_data['lat_decimal'], latest_data['lon_decimal'],
+                          latest_data.get('alt', 'N/A'), alt_source, latest_data.get('co2', 'N/A'))
+            broadcast_sensor_update(latest_data)
+            log.debug("✅ Data emitted successfully")
             
         except Exception as e:
-            print(f"❌ Error emitting data: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("❌ Error emitting data: %s", e)
 
     def run_reader(self):
         """Main reader loop with precise 1-second timing"""
-        print(f"🚀 Starting data reader - Mode: {'Mock' if config.USE_MOCK else 'Serial Device'}")
-        print(f"📡 Port: {config.SERIAL_PORT} | Baud: {config.BAUD_RATE} | Timeout: {config.TIMEOUT}s")
-        print(f"⏰ Update interval: {config.MOCK_UPDATE_INTERVAL} seconds (precise timing)")
-        print(f"🧮 Altitude calculation: Pressure-based when GPS unavailable")
+        # Mode changes from /api/config restart the reader, so these are
+        # fixed for the lifetime of this loop; bind them once
+        use_mock = config.USE_MOCK
+        interval = config.MOCK_UPDATE_INTERVAL
+        source = "mock" if use_mock else "device"
+        generate = self.generate_realistic_mock_data
+        read_serial = self.read_serial_data
+        update_history = self.update_history
+        log_to_csv = self.log_data_to_csv
+        emit = self.emit_data
+        wait = self.stop_event.wait
+        
+        log.info("🚀 Starting data reader - Mode: %s", 'Mock' if use_mock else 'Serial Device')
+        log.info("📡 Port: %s | Baud: %s | Timeout: %ss", config.SERIAL_PORT, config.BAUD_RATE, config.TIMEOUT)
+        log.info("⏰ Update interval: %s seconds (precise timing)", interval)
+        log.info("🧮 Altitude calculation: Pressure-based when GPS unavailable")
         
         iteration_count = 0
         consecutive_failures = 0
         max_failures = 5
-        next_update_time = time.time() + config.MOCK_UPDATE_INTERVAL  # Schedule first update
+        # Open the device once before the timed loop and give it time to
+        # initialize, so the 2 s settle never lands inside a tick
+        if not use_mock and serial and self.connect_serial():
+            if wait(2):
+                return
+        
+        next_update_time = time.time() + interval  # Schedule first update
         
         while self.running:
+            # Sleep until the next update is due; stop() wakes us immediately
+            delay = next_update_time - time.time()
+            if delay > 0 and wait(delay):
+                break
+            
             try:
                 current_time = time.time()
+                start_time = current_time
+                timestamp = current_time
+                now = datetime.fromtimestamp(current_time)  # Shared by mock data and logging
+                data_updated = False
+                iteration_count += 1
                 
-                # Check if it's time for the next update
-                if current_time >= next_update_time:
-                    start_time = current_time
-                    timestamp = current_time
-                    data_updated = False
-                    iteration_count += 1
-                    
-                    print(f"🔄 Reader iteration #{iteration_count} ({'Mock' if config.USE_MOCK else 'Device'}) - {time.strftime('%H:%M:%S', time.localtime(current_time))}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("🔄 Reader iteration #%d (%s) - %s", iteration_count,
+                              'Mock' if use_mock else 'Device',
+                              now.strftime('%H:%M:%S'))
+                
+                if use_mock:
+                    generate(now)
+                    data_updated = True
+                    consecutive_failures = 0
+                else:
+                    data_updated = read_serial()
                     
-                    if config.USE_MOCK:
-                        self.generate_realistic_mock_data()
-                        data_updated = True
+                    if data_updated:
                         consecutive_failures = 0
                     else:
-                        data_updated = self.read_serial_data()
+                        consecutive_failures += 1
+                        log.warning("⚠️ No data received (failure #%d/%d)", consecutive_failures, max_failures)
                         
-                        if data_updated:
+                        if consecutive_failures >= max_failures:
+                            log.warning("❌ Too many failures, switching to mock mode temporarily")
+                            # Don't actually switch config.USE_MOCK, just generate mock data for this iteration
+                            generate()
+                            data_updated = True
                             consecutive_failures = 0
-                        else:
-                            consecutive_failures += 1
-                            print(f"⚠️ No data received (failure #{consecutive_failures}/{max_failures})")
-                            
-                            if consecutive_failures >= max_failures:
-                                print(f"❌ Too many failures, switching to mock mode temporarily")
-                                # Don't actually switch config.USE_MOCK, just generate mock data for this iteration
-                                self.generate_realistic_mock_data()
-                                data_updated = True
-                                consecutive_failures = 0
-                    
-                    if data_updated:
-                        print(f"📈 Data updated, logging and emitting...")
-                        self.update_history(timestamp)
-                        self.log_data_to_csv(timestamp)
-                        self.emit_data(timestamp)
-                        update_system_status("mock" if config.USE_MOCK else "device")
-                    else:
-                        print(f"⚠️ No data update in iteration #{iteration_count}")
-                    
-                    # Schedule next update time (precise intervals)
-                    processing_time = time.time() - start_time
-                    next_update_time += config.MOCK_UPDATE_INTERVAL
-                    
-                    # If we're falling behind, catch up but warn
-                    if next_update_time <= time.time():
-                        print(f"⚠️ Processing took {processing_time:.3f}s, falling behind schedule")
-                        next_update_time = time.time() + config.MOCK_UPDATE_INTERVAL
-                    
-                    print(f"⏱️ Next update scheduled in {next_update_time - time.time():.3f}s")
                 
-                # Short sleep to prevent busy waiting
-                time.sleep(0.01)  # 10ms sleep
+                if data_updated:
+                    log.debug("📈 Data updated, logging and emitting...")
+                    # Finish every latest_data field (decimals, timestamp,
+                    # source) before it is published, since emit_data sends
+                    # the dict as-is
+                    update_decimal_coordinates()
+                    latest_data["timestamp"] = timestamp
+                    update_system_status(source)
+                    update_history(timestamp)
+                    log_to_csv(timestamp)
+                    emit(timestamp)
+                else:
+                    log.debug("⚠️ No data update in iteration #%d", iteration_count)
+                
+                # Schedule next update time (precise intervals)
+                processing_time = time.time() - start_time
+                next_update_time += interval
+                
+                # If we're falling behind, catch up but warn
+                if next_update_time <= time.time():
+                    log.warning("⚠️ Processing took %.3fs, falling behind schedule", processing_time)
+                    next_update_time = time.time() + interval
+                
+                log.debug("⏱️ Next update scheduled in %.3fs", next_update_time - time.time())
                 
             except KeyboardInterrupt:
-                print("🛑 Reader stopped by user")
+                log.info("🛑 Reader stopped by user")
                 break
             except Exception as e:
-                print(f"❌ Error in reader loop: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("❌ Error in reader loop: %s", e)
                 consecutive_failures += 1
-                time.sleep(0.1)  # Brief pause on error
                 
                 if consecutive_failures >= max_failures:
-                    print("❌ Too many errors, stopping reader")
+                    log.error("❌ Too many errors, stopping reader")
+                    break
+                
+                if wait(0.1):  # Brief pause on error
                     break      
       
     def start(self):
         """Start the reader thread"""
-        print(f"🔧 Starting DataReader thread...")
+        log.info("🔧 Starting DataReader thread...")
         self.running = True
-        thread = threading.Thread(target=self.run_reader, daemon=True, name="DataReader")
-        thread.start()
-        print(f"✅ DataReader thread started: {thread.name}")
+        # Let SocketIO pick the task type so the reader cooperates with
+        # eventlet/gevent as well as plain threads
+        thread = self.socketio.start_background_task(self.run_reader)
+        log.info("✅ DataReader thread started (%s)", self.socketio.async_mode)
         return thread
 
     def stop(self):
         """Stop the reader"""
-        print(f"🛑 Stopping DataReader...")
+        log.info("🛑 Stopping DataReader...")
         self.running = False
+        self.stop_event.set()
         if self.serial_conn:
             try:
                 self.serial_conn.close()
-                print("📡 Serial connection closed")
+                log.info("📡 Serial connection closed")
             except:
                 pass
             self.serial_conn = None
+        
+        # Let the writer drain queued rows, then release the log file
+        if self.csv_file:
+            self.csv_queue.put(None)
+            self.csv_thread.join(timeout=5)
+            if self.csv_thread.is_alive():
+                log.warning("⚠️ CSV writer still busy, leaving %s open", config.CSV_FILE)
+            else:
+                self.csv_file.close()
+            self.csv_file = None
 
 # Global reader instance
 reader_instance = None
@@ -545,18 +565,18 @@ reader_instance = None
 def start_reader(socketio):
     """Start the data reader"""
     global reader_instance
-    print(f"🚀 start_reader called with socketio: {socketio}")
+    log.info("🚀 start_reader called with socketio: %s", socketio)
     
     if reader_instance is not None:
-        print("⚠️ DataReader already exists, stopping previous instance")
+        log.warning("⚠️ DataReader already exists, stopping previous instance")
         reader_instance.stop()
-        time.sleep(1)  # Give it time to stop
+        socketio.sleep(1)  # Give it time to stop
     
     reader_instance = DataReader(socketio)
     thread = reader_instance.start()
     
     # Give it a moment to start
-    time.sleep(0.5)
+    socketio.sleep(0.5)
     
     return thread
 
@@ -582,7 +602,7 @@ def get_available_ports():
             })
         return ports
     except Exception as e:
-        print(f"Error getting available ports: {e}")
+        log.error("Error getting available ports: %s", e)
         return []
 
 def test_serial_connection(port=None, baud_rate=None):
@@ -1,5 +1,45 @@
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional speed-up; without it these stay plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Barometric formula: h = ((P0/P)^(1/5.257) - 1) * (T + 273.15) / 0.0065
+_BARO_EXPONENT = 1 / 5.257
+_INV_LAPSE_RATE = 1 / 0.0065  # 1 / temperature lapse rate (K/m)
+
+_INV_60 = 1 / 60  # Minutes to degrees
+
+@njit(cache=True)
+def gps_to_decimal(coord):
+    """Convert a DDMM.MMMMM coordinate to decimal degrees"""
+    # Truncate toward zero (not divmod's floor) so negative inputs keep the
+    # sign on both parts; a no-fix 0 still maps to 0 without a special case
+    degrees = int(coord / 100)
+    minutes = coord - degrees * 100
+    return degrees + minutes * _INV_60
+
+@njit(cache=True)
+def barometric_altitude(pressure_mb, temperature_c, sea_level_pressure):
+    """Altitude in meters (rounded to 0.1) from pressure and temperature"""
+    pressure_ratio = sea_level_pressure / pressure_mb
+    altitude = ((pressure_ratio ** _BARO_EXPONENT) - 1) * (temperature_c + 273.15) * _INV_LAPSE_RATE
+    return round(altitude, 1)
+
+@njit(cache=True)
+def mock_baselines(elapsed):
+    """Noise-free mock sensor values: (temp, thermal temp, pressure, humidity, CO2)"""
+    base_temp = 25 + (math.sin(elapsed / 3600) * 0.3 + 0.7) * 5  # 20-30°C daily range
+    thermal_temp = 26.04 + math.sin(elapsed / 200) * 2
+    pressure = 968.15 + math.sin(elapsed / 300) * 5
+    humidity = 50 - (base_temp - 25) * 1.5  # Inverse temperature correlation
+    co2 = 700 + math.sin(elapsed / 600) * 150 + math.sin(elapsed / 60) * 20
+    return base_temp, thermal_temp, pressure, humidity, co2
+
 def parse_gps_coord(coord_str):
-    val = float(coord_str)
-    degrees = int(val / 100)
-    minutes = val - (degrees * 100)
-    return degrees + (minutes / 60)
+    return gps_to_decimal(float(coord_str))
\ No newline at end of file
@@ -1,9 +1,21 @@
+import os
+
+# eventlet/gevent only cooperate with the blocking serial reads and worker
+# threads once the stdlib is patched, and patching must happen before Flask,
+# pyserial or threading are imported. Threading stays the default (see
+# config.SOCKETIO_ASYNC_MODE): pyserial's Windows backend blocks even when
+# patched, so opt in with IOT_ASYNC_MODE only on POSIX hosts.
+_async_mode = os.environ.get('IOT_ASYNC_MODE')
+if _async_mode == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif _async_mode == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
 from app import create_app, socketio
-from app.serial_reader import start_reader, get_available_ports, test_serial_connection
+from app.serial_reader import start_reader, stop_reader, get_available_ports, test_serial_connection, CSV_HEADER
 from app import config
-import os
-import time
-import threading
 import sys
 
 def print_banner():
@@ -54,19 +66,14 @@ def setup_csv_file():
         with open(config.CSV_FILE, 'w', newline='') as f:
             import csv
             writer = csv.writer(f)
-            writer.writerow([
-                'timestamp', 'lat_decimal', 'lon_decimal', 'lat_raw', 'lon_raw', 
-                'alt', 'satellites', 'utc_time', 'rtc_date', 'rtc_time', 
-                'ms5611_temp', 'pressure', 'ds18b20_temp', 'scd30_temp', 
-                'rh', 'co2', 'thermal_temp', 'heating_status', 'target_range'
-            ])
+            writer.writerow(CSV_HEADER)
         print(f"📄 Created CSV file: {config.CSV_FILE}")
     else:
         print(f"📄 Using existing CSV file: {config.CSV_FILE}")
 
 def delayed_start_reader():
     """Start data reader after Flask initialization"""
-    time.sleep(2)  # Give Flask time to fully initialize
+    socketio.sleep(2)  # Give Flask time to fully initialize
     print("\n🔧 Starting data reader...")
     
     try:
@@ -98,6 +105,14 @@ def check_dependencies():
         print("❌ pyserial: Not installed")
         print("   Install with: pip install pyserial")
     
+    # Check numba (optional)
+    try:
+        import numba
+        print(f"✅ numba: {numba.__version__} (JIT-compiled sensor math)")
+    except ImportError:
+        print("ℹ️  numba: Not installed (optional, speeds up sensor math)")
+        print("   Install with: pip install numba")
+    
     # Check Flask
     try:
         import flask
@@ -179,8 +194,7 @@ def main():
     app = create_app()
     
     # Start data reader in background
-    reader_thread = threading.Thread(target=delayed_start_reader, daemon=True)
-    reader_thread.start()
+    socketio.start_background_task(delayed_start_reader)
     
     # Print final startup info
     print("\n🌐 DASHBOARD READY!")
@@ -193,23 +207,32 @@ def main():
     print("\n" + "=" * 80)
     
     # Run the application
+    run_options = {}
+    if socketio.async_mode == 'threading':
+        # Only the Werkzeug fallback server needs this flag
+        run_options['allow_unsafe_werkzeug'] = True
+    
     try:
         socketio.run(
             app, 
             debug=False, 
             host='0.0.0.0', 
             port=5001, 
-            allow_unsafe_werkzeug=True,
-            use_reloader=False  # Disable reloader to prevent duplicate threads
+            use_reloader=False,  # Disable reloader to prevent duplicate threads
+            **run_options
         )
     except KeyboardInterrupt:
         print("\n🛑 Dashboard stopped by user")
-        print("📁 Data has been saved to:", config.CSV_FILE)
-        print("👋 Goodbye!")
     except Exception as e:
         print(f"\n❌ Error starting dashboard: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        # The servers handle Ctrl+C themselves and just return, so the
+        # reader is stopped (and queued CSV rows written) here
+        stop_reader()
+        print("📁 Data has been saved to:", config.CSV_FILE)
+        print("👋 Goodbye!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file